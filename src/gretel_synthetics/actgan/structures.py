@@ -3,7 +3,7 @@ Complex datastructures for ACTGAN
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, TYPE_CHECKING
 
@@ -51,4 +51,4 @@ class EpochInfo:
     loss_d: float
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {"epoch": self.epoch, "loss_g": self.loss_g, "loss_d": self.loss_d}
@@ -1,21 +1,29 @@
+import gzip
+import io
 import json
 import random
 import shutil
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import asdict
 from itertools import zip_longest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import cloudpickle
 import pandas as pd
 import pytest
 
 from gretel_synthetics.batch import (
     _BufferedDataFrame,
+    _generate_batch_lines_worker,
+    _run_in_process_pool,
     _validate_batch_seed_values,
     DataFrameBatch,
     FILE,
+    GenerationSummary,
     MAX_INVALID,
     MEMORY,
     ORIG_HEADERS,
@@ -23,6 +31,7 @@ from gretel_synthetics.batch import (
 )
 from gretel_synthetics.errors import TooManyInvalidError
 from gretel_synthetics.generate import GenText
+from gretel_synthetics.tokenizers import CharTokenizerTrainer
 
 checkpoint_dir = str(Path(__file__).parent / "checkpoints")
 
@@ -227,6 +236,150 @@ def test_batches_to_df(test_data):
         "int64",
     ]
 
+    # the synthetic DF is cached until new lines are added
+    batch_df = batches.batches[0].synthetic_df
+    assert batches.batches[0].synthetic_df is batch_df
+    batches.batches[0].add_valid_data(
+        GenText(text="qux|qux1", valid=True, delimiter="|")
+    )
+    assert batches.batches[0].synthetic_df is not batch_df
+    assert batches.batches[0].synthetic_df.shape == (2, 2)
+    batches.batches[0].reset_gen_data()
+    assert batches.batches[0].synthetic_df.shape == (0, 2)
+
+    # modifying the returned DataFrames must not change the cached one
+    batches.batches[0].add_valid_data(
+        GenText(text="qux|qux1", valid=True, delimiter="|")
+    )
+    batch_df = batches.batch_to_df(0)
+    batch_df["foo"] = "changed"
+    all_df = batches.batches_to_df()
+    all_df["foo1"] = "changed"
+    assert batches.batch_to_df(0).values.tolist() == [["qux", "qux1"]]
+    assert batches.batches_to_df()["foo1"].tolist() == ["qux1"]
+
+    with pytest.raises(ValueError):
+        batches.batch_to_df(99)
+
+
+def test_add_valid_data_bulk(test_data):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": "bar1"}])
+    batches = DataFrameBatch(df=_df, config=config_template)
+    batch = batches.batches[0]
+
+    batch.add_valid_data(GenText(text="a|1", valid=True))
+    batch.add_valid_data_bulk(
+        [GenText(text="b|2", valid=True), GenText(text="c|3", valid=None)]
+    )
+    batch.add_valid_data_bulk([])
+    assert batch.gen_data_count == 3
+    assert batch.synthetic_df.values.tolist() == [["a", 1], ["b", 2], ["c", 3]]
+
+
+def test_batch_pickle(test_data):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": "bar1"}])
+    batches = DataFrameBatch(df=_df, config=config_template)
+    batch = batches.batches[0]
+    batch.add_valid_data(GenText(text="baz|unic\U0001f499ode", valid=True))
+
+    # generated lines should
+    # survive being sent to a worker process
+    copied = cloudpickle.loads(cloudpickle.dumps(batch))
+    assert copied.gen_data_count == 1
+    assert copied.synthetic_df.equals(batch.synthetic_df)
+    assert copied.get_validator()("a|b")
+
+    copied.add_valid_data(GenText(text="qux|qux1", valid=True))
+    assert copied.synthetic_df.shape == (2, 2)
+    assert batch.synthetic_df.shape == (1, 2)
+
+
+def test_batch_gen_data_text(test_data):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": "bar1"}])
+    batches = DataFrameBatch(df=_df, config=config_template)
+    batch = batches.batches[0]
+    assert batch.gen_data_text == "foo|foo1\n"
+    assert batch.synthetic_df.columns.tolist() == ["foo", "foo1"]
+
+    batch.add_valid_data(GenText(text="baz|baz1", valid=True))
+    assert batch.gen_data_text == "foo|foo1\nbaz|baz1\n"
+
+    # the stream is a read-only snapshot, writes should not be silently lost
+    stream = batch.gen_data_stream
+    assert stream.getvalue() == "foo|foo1\nbaz|baz1\n"
+    stream.seek(0)
+    assert stream.readline() == "foo|foo1\n"
+    assert not stream.writable()
+    with pytest.raises(io.UnsupportedOperation):
+        stream.write("qux|qux1\n")
+    assert batch.gen_data_count == 1
+
+
+def test_create_training_data_fills_na(test_data):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": None}, {"foo": None, "foo1": "baz"}])
+    batches = DataFrameBatch(df=_df, config=config_template)
+    batches.create_training_data()
+
+    assert batches.batches[0].training_df.values.tolist() == [["bar", ""], ["", "baz"]]
+    assert Path(batches.batches[0].input_data_path).read_text() == "bar|\n|baz\n"
+
+    # the source DataFrame should not be modified
+    assert _df.isna().sum().sum() == 2
+
+
+def test_basic_validator(test_data):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": "bar1", "foo2": "bar2"}])
+    batches = DataFrameBatch(df=_df, config=config_template)
+    validator = batches.batches[0].get_validator()
+    assert validator("a|b|c")
+    assert validator("||")
+    assert not validator("a|b")
+    assert not validator("a|b|c|d")
+
+
+def test_validator_file_formats(tmp_path):
+    _df = pd.DataFrame([{"foo": "bar", "foo1": "bar1"}])
+    config = {**config_template, "checkpoint_dir": str(tmp_path)}
+    batches = DataFrameBatch(df=_df, config=config)
+    batch = batches.batches[0]
+    ckpoint = Path(batch.checkpoint_dir)
+
+    # small validators are stored without compression, in a
+    # file that older versions can still read
+    batch.set_validator(simple_validator)
+    assert [p.name for p in ckpoint.glob("validator.*")] == ["validator.p.gz"]
+    with gzip.open(ckpoint / "validator.p.gz", "r") as fin:
+        assert cloudpickle.load(fin)("1,2,3,4,5")
+    batch.validator = None
+    batch.load_validator_from_file()
+    assert batch.validator("1,2,3,4,5")
+
+    # large validators get compressed, and replace the old file. zstandard
+    # is optional, without it gzip is used
+    values = set(str(i) for i in range(10000))
+    batch.set_validator(lambda line: line in values)
+    saved = [p.name for p in ckpoint.glob("validator.*")]
+    assert saved in (["validator.p.zst"], ["validator.p.gz"])
+    batch.validator = None
+    batch.load_validator_from_file()
+    assert batch.validator("42")
+    assert not batch.validator("foo")
+
+    # validators saved by older versions are gzipped
+    (ckpoint / saved[0]).unlink()
+    with gzip.open(ckpoint / "validator.p.gz", "w") as fout:
+        fout.write(cloudpickle.dumps(simple_validator))
+    batch.validator = None
+    batch.load_validator_from_file()
+    assert batch.validator("1,2,3,4,5")
+
+    # uncompressed validators can be loaded too
+    (ckpoint / "validator.p.gz").unlink()
+    (ckpoint / "validator.p").write_bytes(cloudpickle.dumps(simple_validator))
+    batch.validator = None
+    batch.load_validator_from_file()
+    assert batch.validator("1,2,3,4,5")
+
 
 def test_generate_batch_lines_raise_on_exceed(test_data):
     batches = DataFrameBatch(df=test_data, config=config_template)
@@ -290,6 +443,140 @@ def test_generate_all_batch_lines_raise_on_failed(test_data):
     }
 
 
+@patch("gretel_synthetics.batch.loky.ProcessPoolExecutor", ThreadPoolExecutor)
+def test_all_batches_n_jobs(test_data):
+    batches = DataFrameBatch(df=test_data, config=config_template)
+    batches.create_training_data()
+
+    with patch("gretel_synthetics.batch.train") as mock_train:
+        batches.train_all_batches(n_jobs=4)
+        assert mock_train.call_count == len(batches.batches)
+        called_args = sorted(a[0].checkpoint_dir for _, a, _ in mock_train.mock_calls)
+        assert called_args == sorted(b.checkpoint_dir for b in batches.batches.values())
+
+    def _gen_text(config, **kwargs):
+        batch = next(b for b in batches.batches.values() if b.config is config)
+        good = GenText(text="|".join(["1"] * len(batch.headers)), valid=True)
+        bad = GenText(text="1|2", valid=False)
+        return [good, bad, good]
+
+    with patch("gretel_synthetics.batch.generate_text") as mock_gen:
+        mock_gen.side_effect = _gen_text
+        summaries = batches.generate_all_batch_lines(num_lines=2, n_jobs=4)
+        # jobs should not each start a worker per CPU by default
+        assert {c.kwargs["parallelism"] for c in mock_gen.mock_calls} == {1}
+
+    assert list(summaries.keys()) == list(batches.batches.keys())
+    for idx, batch in batches.batches.items():
+        assert summaries[idx].valid_lines == 2
+        assert summaries[idx].invalid_lines == 1
+        assert summaries[idx].is_valid
+        assert batch.gen_data_count == 2
+        assert len(batch.gen_data_invalid) == 1
+        assert batch.synthetic_df.shape == (2, len(batch.headers))
+
+
+@patch("gretel_synthetics.batch.loky.ProcessPoolExecutor", ThreadPoolExecutor)
+def test_all_batches_n_jobs_failed_batch(test_data):
+    batches = DataFrameBatch(df=test_data, config=config_template)
+    batches.create_training_data()
+    failing_config = batches.batches[1].config
+
+    def _gen_text(config, **kwargs):
+        if config is failing_config:
+            raise TooManyInvalidError()
+        batch = next(b for b in batches.batches.values() if b.config is config)
+        return [GenText(text="|".join(["1"] * len(batch.headers)), valid=True)] * 2
+
+    with patch("gretel_synthetics.batch.generate_text") as mock_gen:
+        mock_gen.side_effect = _gen_text
+        with pytest.raises(TooManyInvalidError):
+            batches.generate_all_batch_lines(
+                num_lines=2, n_jobs=2, raise_on_failed_batch=True
+            )
+
+    # the first batch finished before the failure, so it keeps its data
+    assert batches.batches[0].gen_data_count == 2
+    assert batches.batches[1].gen_data_count == 0
+
+
+@patch("gretel_synthetics.batch.loky.ProcessPoolExecutor", ThreadPoolExecutor)
+def test_run_in_process_pool():
+    assert _run_in_process_pool(str, [], 4) == []
+    assert _run_in_process_pool(str, [(1,), (2,)], 4) == ["1", "2"]
+
+    called = []
+    kept = []
+
+    def _fn(i):
+        called.append(i)
+        if i == 1:
+            raise ValueError("nope")
+        time.sleep(0.1)
+        return i
+
+    with pytest.raises(ValueError):
+        _run_in_process_pool(
+            _fn, [(i,) for i in range(10)], 1, on_result=lambda i, r: kept.append(r)
+        )
+
+    # tasks that did not start yet when the second one failed are cancelled
+    assert called[:2] == [0, 1]
+    assert len(called) < 10
+    assert kept[0] == 0
+    assert 1 not in kept
+
+
+@pytest.mark.parametrize("n_jobs", [0, -1, 1.5, None])
+def test_all_batches_invalid_n_jobs(test_data, n_jobs):
+    batches = DataFrameBatch(df=test_data, config=config_template)
+
+    with pytest.raises(ValueError):
+        batches.train_all_batches(n_jobs=n_jobs)
+    with pytest.raises(ValueError):
+        batches.generate_all_batch_lines(n_jobs=n_jobs)
+
+
+def test_all_batches_n_jobs_pickle(test_data):
+    batches = DataFrameBatch(
+        df=test_data.iloc[:, :4],
+        config=config_template,
+        batch_size=2,
+        tokenizer=CharTokenizerTrainer(config=None),
+    )
+    batches.create_training_data()
+    batches.set_batch_validator(0, simple_validator)
+
+    # everything sent to the training workers must survive pickling
+    for (config, tokenizer), batch in zip(
+        cloudpickle.loads(cloudpickle.dumps(batches._train_pool_args())),
+        batches.batches.values(),
+    ):
+        assert asdict(config) == asdict(batch.config)
+        assert asdict(tokenizer.config) == asdict(batch.config)
+
+    # same for the generation workers, and what they send back
+    args_list = cloudpickle.loads(
+        cloudpickle.dumps(batches._generate_pool_args({"num_lines": 2}))
+    )
+    assert [a[1] for a in args_list] == list(batches.batches.keys())
+    worker_batch, idx, kwargs = args_list[0]
+    assert worker_batch.headers == batches.batches[0].headers
+    assert asdict(worker_batch.config) == asdict(batches.batches[0].config)
+    assert worker_batch.get_validator()("1,2,3,4,5")
+
+    line = GenText(text="1|2", valid=True)
+    with patch("gretel_synthetics.batch.generate_text") as mock_gen:
+        mock_gen.return_value = [line, GenText(text="1", valid=False), line]
+        result = _generate_batch_lines_worker(worker_batch, idx, kwargs)
+
+    summary, returned_batch = cloudpickle.loads(cloudpickle.dumps(result))
+    assert summary == GenerationSummary(valid_lines=2, invalid_lines=1, is_valid=True)
+    assert returned_batch.gen_data_count == 2
+    assert [g.text for g in returned_batch.gen_data_invalid] == ["1"]
+    assert returned_batch.synthetic_df.shape == (2, 2)
+
+
 @patch("gretel_synthetics.batch.DataFrameBatch.generate_all_batch_lines")
 def test_read_mode(mock_gen, test_data):
     writer = DataFrameBatch(df=test_data, config=config_template)
@@ -384,6 +671,13 @@ def test_validate_seed_lines_ok_two_field(test_data):
     assert check == "foo|1|"
 
 
+def test_create_training_data_single_column(test_data):
+    _df = pd.DataFrame({"a": ["x", None, "y"]})
+    batches = DataFrameBatch(df=_df, config=config_template)
+    batches.create_training_data()
+    assert Path(batches.batches[0].input_data_path).read_text() == 'x\n""\ny\n'
+
+
 @pytest.mark.parametrize("buffermode", [MEMORY, FILE])
 def test_buffered_df(buffermode):
     buffer = _BufferedDataFrame(",", ["foo", "bar", "baz"], method=buffermode)